@@ -1,8 +1,36 @@
 """
 Source code to reproduce experiments of Herron 2012 paper.
 """
+import functools
+import math
+import numbers
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
+MINIMUM_NUMBER_OF_SAMPLES_FOR_THREADS = 100_000
+
+
+def get_generator(seed=None):
+    """
+    Return a random number generator.
+
+    This uses the SFC64 bit generator which samples normal random variables faster
+    than numpy's default (PCG64).
+
+    Args:
+        seed : int, numpy.random.SeedSequence or numpy.random.Generator
+            The random seed for the number generator. Allows for reproducible sampling.
+            If this is already a generator it is returned as is.
+
+    Returns:
+        numpy.random.Generator
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.Generator(np.random.SFC64(seed))
+
 
 def create_manuscripts(number_of_manuscripts, seed=None):
     """
@@ -12,40 +40,190 @@ def create_manuscripts(number_of_manuscripts, seed=None):
     Args:
         number_of_manuscripts : int
             The number of manuscripts to be sampled
-        seed : int
+        seed : int, numpy.random.SeedSequence or numpy.random.Generator
             The random seed for the number generator. Allows for reproducible sampling.
 
     Returns:
         array
         A numpy array of integers corresponding to the manuscripts.
     """
-    np.random.seed(seed)
-    return np.random.randint(low=1, high=10 + 1, size=number_of_manuscripts)
+    rng = get_generator(seed)
+    return rng.integers(low=1, high=10 + 1, size=number_of_manuscripts)
+
+
+def get_error_sd(imprecision_error_sd, other_error_sd):
+    """
+    Return the standard deviation of the sum of the imprecision and other errors.
+
+    Both errors are independent and centred on 0 so their sum is itself
+    normally distributed with standard deviation
+    sqrt(imprecision_error_sd ^ 2 + other_error_sd ^ 2).
+
+    Args:
+        imprecision_error_sd : float
+            The standard deviation corresponding to the imprecision error
+        other_error_sd : float
+            The standard deviation corresponding to the other error
+
+    Returns:
+        float
+    """
+    if imprecision_error_sd < 0 or other_error_sd < 0:
+        raise ValueError(
+            "Standard deviations must be non-negative, not "
+            f"imprecision_error_sd={imprecision_error_sd} and "
+            f"other_error_sd={other_error_sd}."
+        )
+    return math.hypot(imprecision_error_sd, other_error_sd)
 
 
-def review_manuscripts(manuscripts, imprecision_error_sd, other_error_sd):
+def review_into(standard_errors, error_sd, manuscripts, out, clip=True):
+    """
+    Write the reviews of manuscripts with given standard normal errors in to `out`.
+
+    This is the kernel shared by every function sampling reviews, so that they all
+    give exactly the same reviews. The standard normal errors are usually sampled
+    as 32 bit floats, which is faster, but they are scaled and added to the
+    manuscripts as 64 bit floats. Doing this in 32 bit floats would round away
+    errors smaller than about 1e-6 and so change the reviews for small standard
+    deviations.
+
+    Args:
+        standard_errors : array
+            A numpy array of standard normal samples.
+        error_sd : float
+            The standard deviation of the error (see `get_error_sd`).
+        manuscripts : array
+            A numpy array of integers corresponding to manuscripts, broadcast against
+            `standard_errors`.
+        out : array
+            A numpy array of 64 bit floats in which to write the reviews.
+        clip : bool
+            Whether or not to clip the reviews to [1, 10].
+
+    Returns:
+        array
+        `out`.
+    """
+    np.multiply(standard_errors, error_sd, out=out, dtype=np.float64)
+    out += manuscripts
+    if clip:
+        out.clip(1, 10, out=out)
+    return out
+
+
+def review_manuscripts(manuscripts, imprecision_error_sd, other_error_sd, seed=None):
     """
     Given a collection of manuscripts, add the imprecision error
     and the other error as sampled from a normal distribution
 
+    A single sample is taken from the distribution of the sum of both errors
+    (see `get_error_sd`) and the reviews are computed by `review_into`.
+
     Args:
         manuscripts : array
-            A numpy array of integers corresponding to manuscripts.
+            A numpy array of integers corresponding to manuscripts. This can have
+            any shape: each entry is reviewed independently.
         imprecision_error_sd : float
             The standard deviation corresponding to the imprecision error
         other_error_sd : float
             The standard deviation corresponding to the other error
+        seed : int, numpy.random.SeedSequence or numpy.random.Generator
+            The random seed for the number generator. Allows for reproducible sampling.
 
     Returns:
         array
         A numpy array of floats corresponding to the reviews of each manuscript.
+        This has the same shape as `manuscripts`.
     """
-    number_of_manuscripts = len(manuscripts)
-    imprecision_error = np.random.normal(
-        scale=imprecision_error_sd, size=number_of_manuscripts
+    error_sd = get_error_sd(
+        imprecision_error_sd=imprecision_error_sd, other_error_sd=other_error_sd
+    )
+    rng = get_generator(seed)
+    standard_errors = rng.standard_normal(size=np.shape(manuscripts), dtype=np.float32)
+    return review_into(
+        standard_errors=standard_errors,
+        error_sd=error_sd,
+        manuscripts=manuscripts,
+        out=np.empty(np.shape(manuscripts), dtype=np.float64),
     )
-    other_error = np.random.normal(scale=other_error_sd, size=number_of_manuscripts)
-    return np.clip(a=manuscripts + imprecision_error + other_error, a_min=1, a_max=10)
+
+
+def spawn_generators(number_of_generators, seed=None):
+    """
+    Create independent random number generators from a single seed.
+
+    The generators are spawned from a `numpy.random.SeedSequence` so that their
+    streams do not overlap and they can be used from separate threads. If `seed`
+    is a generator, the seed sequence is seeded from it, advancing its stream. If
+    `seed` is already a seed sequence the generators are spawned from it directly.
+
+    Args:
+        number_of_generators : int
+            The number of generators to create.
+        seed : int, numpy.random.SeedSequence or numpy.random.Generator
+            The random seed for the number generator. Allows for reproducible sampling.
+
+    Returns:
+        list
+        A list of numpy.random.Generator.
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        seed_sequence = seed
+    else:
+        rng = get_generator(seed)
+        seed_sequence = np.random.SeedSequence(rng.integers(low=0, high=2**63))
+    return [
+        get_generator(child_seed_sequence)
+        for child_seed_sequence in seed_sequence.spawn(number_of_generators)
+    ]
+
+
+def sum_over_reviews(function, number_of_reviews, manuscripts, seed=None, **kwargs):
+    """
+    Split a number of reviews across threads and add up the result of each thread.
+
+    Starting threads and spawning generators has a fixed cost of a few hundred
+    microseconds, so this is only done when there are at least
+    `MINIMUM_NUMBER_OF_SAMPLES_FOR_THREADS` samples (number of reviews times
+    number of manuscripts) to draw. Below that, every review uses a single
+    generator in the calling thread.
+
+    Above it, every review is given its own generator so that the result does
+    not depend on the number of threads used. The generators are split in to
+    one chunk per thread and `function` is called once per chunk.
+
+    Args:
+        function : function
+            A function taking a list of numpy.random.Generator (one per review) as
+            `generators`, the `manuscripts` and `kwargs` and returning an array.
+        number_of_reviews : int
+            The number of time to repeat the review process. This must be at least 1.
+        manuscripts : array
+            A numpy array of integers corresponding to manuscripts.
+        seed : int, numpy.random.SeedSequence or numpy.random.Generator
+            The random seed for the number generator. Allows for reproducible sampling.
+        kwargs : dict
+            Further keyword arguments passed to `function`.
+
+    Returns:
+        array
+        The sum of the arrays returned for each chunk.
+    """
+    if number_of_reviews < 1:
+        raise ValueError(f"At least one review is required, not {number_of_reviews}.")
+    function = functools.partial(function, manuscripts=manuscripts, **kwargs)
+    if number_of_reviews * len(manuscripts) < MINIMUM_NUMBER_OF_SAMPLES_FOR_THREADS:
+        return function(generators=[get_generator(seed)] * number_of_reviews)
+    generators = spawn_generators(number_of_generators=number_of_reviews, seed=seed)
+    number_of_threads = min(number_of_reviews, os.cpu_count() or 1)
+    if number_of_threads == 1:
+        return function(generators=generators)
+    chunks = [
+        generators[thread::number_of_threads] for thread in range(number_of_threads)
+    ]
+    with ThreadPoolExecutor(max_workers=number_of_threads) as executor:
+        return sum(executor.map(function, chunks))
 
 
 def is_above_threshold(
@@ -68,15 +246,78 @@ def is_above_threshold(
     return manuscripts >= threshold
 
 
+def sum_review_scores(
+    generators,
+    manuscripts,
+    imprecision_error_sd,
+    other_error_sd,
+    antithetic=False,
+):
+    """
+    Get the total review scores over one review per generator.
+
+    If `antithetic` is True each generator gives a pair of antithetic reviews:
+    one using a sampled error and one using its negation.
+
+    Args:
+        generators : list
+            A list of numpy.random.Generator, one for each review.
+        manuscripts : array
+            A numpy array of integers corresponding to manuscripts.
+        imprecision_error_sd : float
+            The standard deviation corresponding to the imprecision error
+        other_error_sd : float
+            The standard deviation corresponding to the other error
+        antithetic : bool
+            Whether or not to use each sampled error twice: once as is and once
+            negated.
+
+    Returns:
+        array
+        A numpy array of floats corresponding to the total review of each manuscript.
+    """
+    # This is `review_manuscripts` with everything that does not depend on the
+    # review computed once, outside of the loop.
+    error_sd = get_error_sd(
+        imprecision_error_sd=imprecision_error_sd, other_error_sd=other_error_sd
+    )
+    error_sds = (error_sd, -error_sd) if antithetic else (error_sd,)
+    manuscripts = np.asarray(manuscripts, dtype=np.float64)
+    total_review_scores = np.zeros_like(manuscripts)
+    standard_error = np.empty(np.shape(manuscripts), dtype=np.float32)
+    review = np.empty_like(manuscripts)
+    for rng in generators:
+        rng.standard_normal(dtype=np.float32, out=standard_error)
+        for signed_error_sd in error_sds:
+            review_into(
+                standard_errors=standard_error,
+                error_sd=signed_error_sd,
+                manuscripts=manuscripts,
+                out=review,
+            )
+            total_review_scores += review
+    return total_review_scores
+
+
 def get_average_review_scores(
     manuscripts,
     number_of_reviews,
     imprecision_error_sd,
     other_error_sd,
+    seed=None,
+    method="mc",
 ):
     """
     Get average review scores over a number of reviewers.
 
+    The reviews are either sampled independently (`method="mc"`) or as antithetic
+    pairs (`method="antithetic"`): the error of every other review is the
+    negation of the previous one. Each review still has the same distribution so
+    the expected average is unchanged, but the errors within a pair cancel out
+    which reduces the variance of the average. The reviews are then no longer
+    independent, which does not model independent reviewers: use this to estimate
+    the average score with fewer samples.
+
     Args:
         manuscripts : array
             A numpy array of integers corresponding to manuscripts.
@@ -86,23 +327,39 @@ def get_average_review_scores(
             The standard deviation corresponding to the imprecision error
         other_error_sd : float
             The standard deviation corresponding to the other error
+        seed : int, numpy.random.SeedSequence or numpy.random.Generator
+            The random seed for the number generator. Allows for reproducible sampling.
+        method : str
+            Either "mc" or "antithetic". The latter requires an even number of
+            reviews.
 
     Returns:
         array
         A numpy array of floats corresponding to the average review of each manuscript.
     """
-    average_review_scores = np.mean(
-        [
-            review_manuscripts(
-                manuscripts=manuscripts,
-                imprecision_error_sd=imprecision_error_sd,
-                other_error_sd=other_error_sd,
+    if method == "mc":
+        antithetic = False
+        number_of_samples = number_of_reviews
+    elif method == "antithetic":
+        if number_of_reviews % 2 != 0:
+            raise ValueError(
+                "Antithetic reviews require an even number of reviews, "
+                f"not {number_of_reviews}."
             )
-            for _ in range(number_of_reviews)
-        ],
-        axis=0,
+        antithetic = True
+        number_of_samples = number_of_reviews // 2
+    else:
+        raise ValueError(f'Unknown method "{method}": use "mc" or "antithetic".')
+    total_review_scores = sum_over_reviews(
+        function=sum_review_scores,
+        number_of_reviews=number_of_samples,
+        seed=seed,
+        manuscripts=manuscripts,
+        imprecision_error_sd=imprecision_error_sd,
+        other_error_sd=other_error_sd,
+        antithetic=antithetic,
     )
-    return average_review_scores
+    return total_review_scores / number_of_reviews
 
 
 def is_above_threshold_based_on_average(
@@ -111,6 +368,7 @@ def is_above_threshold_based_on_average(
     threshold,
     imprecision_error_sd,
     other_error_sd,
+    seed=None,
 ):
     """
     Repeat the reviews and return booleans on
@@ -127,6 +385,8 @@ def is_above_threshold_based_on_average(
             The standard deviation corresponding to the imprecision error
         other_error_sd : float
             The standard deviation corresponding to the other error
+        seed : int, numpy.random.SeedSequence or numpy.random.Generator
+            The random seed for the number generator. Allows for reproducible sampling.
 
     Returns:
         array
@@ -137,30 +397,118 @@ def is_above_threshold_based_on_average(
         number_of_reviews=number_of_reviews,
         imprecision_error_sd=imprecision_error_sd,
         other_error_sd=other_error_sd,
+        seed=seed,
     )
     return average_review_scores >= threshold
 
 
-def count_votes(reviews, threshold):
+def count_votes(reviews, threshold, out=None):
     """
     Given an iterable of iterables of reviews returns the number of votes for each paper.
 
+    An iterable of reviews is never held in memory as a whole: each review is
+    compared to the threshold and added to the running count of votes before the
+    next one is taken, so the peak memory does not grow with the number of
+    reviews.
+
 
     Args:
-        reviews : array
-            A numpy array of floats corresponding to the average review of each manuscript.
+        reviews : array or iterable
+            A numpy array of floats of shape (number of reviews, number of manuscripts)
+            or an iterable of numpy arrays of floats, each corresponding to one review
+            of every manuscript. An iterable is consumed one review at a time so this
+            can be a generator.
+        threshold : int or array
+            A numeric score corresponding to an acceptance threshold for a manuscript,
+            or a numpy array of thresholds broadcast against each review.
+        out : array
+            An optional numpy array of integers in which to write the number of votes.
+            This avoids allocating a new array when counting votes repeatedly. It is
+            required when `reviews` is an iterable that may be empty, as the shape of
+            the votes cannot be known otherwise.
+
+    Returns:
+        array
+        A numpy array of 32 bit integers (or of the type of `out`) corresponding to
+        the number of votes in favour of accepting a paper.
+    """
+    if isinstance(reviews, np.ndarray):
+        dtype = np.int32 if out is None else out.dtype
+        return np.sum(reviews >= threshold, axis=0, dtype=dtype, out=out)
+    number_of_votes = out
+    if number_of_votes is not None:
+        number_of_votes[...] = 0
+    vote = None
+    for review in reviews:
+        if vote is None:
+            shape = np.broadcast(review, threshold).shape
+            vote = np.empty(shape, dtype=bool)
+            if number_of_votes is None:
+                number_of_votes = np.zeros(shape, dtype=np.int32)
+        np.greater_equal(review, threshold, out=vote)
+        number_of_votes += vote
+    if number_of_votes is None:
+        raise ValueError(
+            "Cannot count the votes of an empty iterable of reviews without `out`."
+        )
+    return number_of_votes
+
+
+def count_votes_of_reviews(
+    generators,
+    manuscripts,
+    threshold,
+    imprecision_error_sd,
+    other_error_sd,
+):
+    """
+    Count the votes in favour of each manuscript over one review per generator.
+
+    Args:
+        generators : list
+            A list of numpy.random.Generator, one for each review.
+        manuscripts : array
+            A numpy array of integers corresponding to manuscripts.
         threshold : int
             A numeric score corresponding to an acceptance threshold for a manuscript.
+        imprecision_error_sd : float
+            The standard deviation corresponding to the imprecision error
+        other_error_sd : float
+            The standard deviation corresponding to the other error
 
     Returns:
         array
-        A numpy array of integers corresponding to the number of votes in favour of accepting a
-        paper.
+        A numpy array of 32 bit integers corresponding to the number of votes in favour
+        of accepting a paper.
     """
-    number_of_votes = np.sum(
-        [review >= threshold for review in reviews],
-        axis=0,
+    error_sd = get_error_sd(
+        imprecision_error_sd=imprecision_error_sd, other_error_sd=other_error_sd
     )
+    manuscripts = np.asarray(manuscripts, dtype=np.float64)
+    if error_sd == 0 or not 1 < threshold <= 10:
+        # Every review, once clipped to [1, 10], is on the same side of the
+        # threshold as the clipped manuscript itself.
+        accept = is_above_threshold(
+            manuscripts=np.clip(manuscripts, 1, 10), threshold=threshold
+        )
+        return np.multiply(accept, len(generators), dtype=np.int32)
+    # The reviews are not clipped: for a threshold in (1, 10] a review is above
+    # the threshold if and only if its clipped value is.
+    number_of_votes = np.zeros(np.shape(manuscripts), dtype=np.int32)
+    standard_error = np.empty(np.shape(manuscripts), dtype=np.float32)
+    review = np.empty_like(manuscripts)
+    vote = np.empty(np.shape(manuscripts), dtype=bool)
+    for rng in generators:
+        rng.standard_normal(dtype=np.float32, out=standard_error)
+        review_into(
+            standard_errors=standard_error,
+            error_sd=error_sd,
+            manuscripts=manuscripts,
+            out=review,
+            clip=False,
+        )
+        np.greater_equal(review, threshold, out=vote)
+        number_of_votes += vote
     return number_of_votes
 
 
@@ -170,6 +518,7 @@ def is_above_threshold_based_on_vote(
     threshold,
     imprecision_error_sd,
     other_error_sd,
+    seed=None,
 ):
     """
     Repeat the reviews and return booleans on
@@ -186,22 +535,24 @@ def is_above_threshold_based_on_vote(
             The standard deviation corresponding to the imprecision error
         other_error_sd : float
             The standard deviation corresponding to the other error
+        seed : int, numpy.random.SeedSequence or numpy.random.Generator
+            The random seed for the number generator. Allows for reproducible sampling.
 
     Returns:
         array
         A numpy array of booleans indicating if the number of votes for a given paper
         is above the majority.
     """
-    reviews = (
-        review_manuscripts(
-            manuscripts=manuscripts,
-            imprecision_error_sd=imprecision_error_sd,
-            other_error_sd=other_error_sd,
-        )
-        for _ in range(number_of_reviews)
+    number_of_votes = sum_over_reviews(
+        function=count_votes_of_reviews,
+        number_of_reviews=number_of_reviews,
+        seed=seed,
+        manuscripts=manuscripts,
+        threshold=threshold,
+        imprecision_error_sd=imprecision_error_sd,
+        other_error_sd=other_error_sd,
     )
-    number_of_votes = count_votes(reviews=reviews, threshold=threshold)
-    return number_of_votes >= int(number_of_reviews / 2)
+    return number_of_votes >= number_of_reviews // 2
 
 
 def accuracy_of_process(
@@ -211,6 +562,8 @@ def accuracy_of_process(
     number_of_reviews,
     imprecision_error_sd,
     other_error_sd,
+    seed=None,
+    accurate_decisions=None,
 ):
     """
     Return the accuracy of a given review process.
@@ -231,20 +584,177 @@ def accuracy_of_process(
             The standard deviation corresponding to the imprecision error
         other_error_sd : float
             The standard deviation corresponding to the other error
+        seed : int, numpy.random.SeedSequence or numpy.random.Generator
+            The random seed for the number generator. Allows for reproducible sampling.
+        accurate_decisions : array
+            An optional numpy array of booleans corresponding to the accurate decisions
+            for `manuscripts` and `threshold` as given by `is_above_threshold`. Passing
+            this avoids recomputing it when measuring the accuracy of many processes
+            for the same manuscripts.
 
     Returns:
         float
         The proportion of papers that were accepted correctly or rejected correctly.
     """
-    accurate_decisions = is_above_threshold(
-        manuscripts=manuscripts,
-        threshold=threshold,
-    )
+    if accurate_decisions is None:
+        accurate_decisions = is_above_threshold(
+            manuscripts=manuscripts,
+            threshold=threshold,
+        )
     decisions = process(
         manuscripts=manuscripts,
         threshold=threshold,
         number_of_reviews=number_of_reviews,
         imprecision_error_sd=imprecision_error_sd,
         other_error_sd=other_error_sd,
+        seed=seed,
+    )
+    return np.count_nonzero(decisions == accurate_decisions) / len(manuscripts)
+
+
+def specialise_accuracy_of_process(manuscripts, threshold):
+    """
+    Return `accuracy_of_process` for fixed manuscripts and threshold.
+
+    The accurate decisions only depend on the manuscripts and the threshold so
+    they are computed once here and reused by every call of the returned
+    function.
+
+    Args:
+        manuscripts : array
+            A numpy array of integers corresponding to manuscripts.
+        threshold : int
+            A numeric score corresponding to an acceptance threshold for a manuscript.
+
+    Returns:
+        function
+        `accuracy_of_process` taking the remaining arguments: `process`,
+        `number_of_reviews`, `imprecision_error_sd`, `other_error_sd` and `seed`.
+    """
+    return functools.partial(
+        accuracy_of_process,
+        manuscripts=manuscripts,
+        threshold=threshold,
+        accurate_decisions=is_above_threshold(
+            manuscripts=manuscripts, threshold=threshold
+        ),
     )
-    return np.sum(decisions == accurate_decisions) / len(manuscripts)
+
+
+@functools.lru_cache(maxsize=8)
+def get_standard_errors(number_of_reviews, number_of_manuscripts, seed):
+    """
+    Sample standard normal errors for a number of reviews of every manuscript.
+
+    The samples only depend on the arguments so they are cached: repeated sweeps
+    with the same seed reuse them rather than sampling again. The returned array
+    is read only as it is shared between calls.
+
+    Each cached array takes 4 bytes per review of every manuscript (about 20MB
+    for 10 reviews of 500,000 manuscripts) and up to 8 of them are kept for the
+    life of the process. Call `get_standard_errors.cache_clear()` to free them.
+
+    Args:
+        number_of_reviews : int
+            The number of time to repeat the review process.
+        number_of_manuscripts : int
+            The number of manuscripts.
+        seed : int
+            The random seed for the number generator.
+
+    Returns:
+        array
+        A read only numpy array of 32 bit floats of shape
+        (number of reviews, number of manuscripts).
+    """
+    rng = get_generator(seed)
+    standard_errors = rng.standard_normal(
+        size=(number_of_reviews, number_of_manuscripts), dtype=np.float32
+    )
+    standard_errors.flags.writeable = False
+    return standard_errors
+
+
+def sweep_accuracy_of_processes(
+    manuscripts,
+    thresholds,
+    number_of_reviews,
+    imprecision_error_sds,
+    other_error_sds,
+    seed=None,
+):
+    """
+    Return the accuracy of the average and the vote review processes over a grid
+    of thresholds and error standard deviations.
+
+    A single sample of standard normal errors is taken and rescaled for every pair
+    of error standard deviations, and every threshold is compared against the same
+    reviews. This reuses the (expensive) random sampling across the whole grid.
+
+    Args:
+        manuscripts : array
+            A numpy array of integers corresponding to manuscripts.
+        thresholds : array
+            A numpy array of numeric scores corresponding to acceptance thresholds.
+        number_of_reviews : int
+            The number of time to repeat the review process.
+        imprecision_error_sds : array
+            A numpy array of standard deviations corresponding to the imprecision error
+        other_error_sds : array
+            A numpy array of standard deviations corresponding to the other error
+        seed : int, numpy.random.SeedSequence or numpy.random.Generator
+            The random seed for the number generator. Allows for reproducible sampling.
+            The errors sampled for an integer seed are cached by
+            `get_standard_errors`.
+
+    Returns:
+        tuple
+        Two numpy arrays of floats of shape (number of imprecision error sds,
+        number of other error sds, number of thresholds): the accuracy of
+        `is_above_threshold_based_on_average` and of
+        `is_above_threshold_based_on_vote`.
+    """
+    thresholds = np.asarray(thresholds)
+    if isinstance(seed, numbers.Integral):
+        standard_errors = get_standard_errors(
+            number_of_reviews=number_of_reviews,
+            number_of_manuscripts=len(manuscripts),
+            seed=int(seed),
+        )
+    else:
+        rng = get_generator(seed)
+        standard_errors = rng.standard_normal(
+            size=(number_of_reviews, len(manuscripts)), dtype=np.float32
+        )
+    accurate_decisions = is_above_threshold(
+        manuscripts=np.asarray(manuscripts)[:, None], threshold=thresholds
+    )
+    shape = (len(imprecision_error_sds), len(other_error_sds), len(thresholds))
+    average_accuracies = np.empty(shape)
+    vote_accuracies = np.empty(shape)
+    reviews = np.empty(np.shape(standard_errors), dtype=np.float64)
+    for i, imprecision_error_sd in enumerate(imprecision_error_sds):
+        for j, other_error_sd in enumerate(other_error_sds):
+            error_sd = get_error_sd(
+                imprecision_error_sd=imprecision_error_sd, other_error_sd=other_error_sd
+            )
+            review_into(
+                standard_errors=standard_errors,
+                error_sd=error_sd,
+                manuscripts=manuscripts,
+                out=reviews,
+            )
+
+            decisions = reviews.mean(axis=0)[:, None] >= thresholds
+            average_accuracies[i, j] = np.count_nonzero(
+                decisions == accurate_decisions, axis=0
+            ) / len(manuscripts)
+
+            number_of_votes = count_votes(
+                reviews=reviews[:, :, None], threshold=thresholds
+            )
+            decisions = number_of_votes >= number_of_reviews // 2
+            vote_accuracies[i, j] = np.count_nonzero(
+                decisions == accurate_decisions, axis=0
+            ) / len(manuscripts)
+    return average_accuracies, vote_accuracies
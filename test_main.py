@@ -1,12 +1,15 @@
 """
 Test file for `main.py`
 """
+import copy
+
 import main
 
 import numpy as np
+import pytest
 
 from hypothesis import given
-from hypothesis.strategies import integers, floats
+from hypothesis.strategies import booleans, integers, floats
 from hypothesis.extra.numpy import arrays
 
 
@@ -50,23 +53,34 @@ def test_create_manuscript_expected_statistics(seed):
     assert np.isclose(np.round(np.std(manuscripts), 1), 2.9)
 
 
+@given(
+    seed=integers(min_value=0, max_value=2**32 - 1),
+)
+def test_get_generator_property(seed):
+    rng = main.get_generator(seed)
+    assert isinstance(rng.bit_generator, np.random.SFC64)
+    assert main.get_generator(rng) is rng
+    assert rng.random() == main.get_generator(seed).random()
+
+
 def test_create_manuscript_example():
     manuscripts = main.create_manuscripts(number_of_manuscripts=10, seed=0)
     expected_manuscripts = np.array(
         [
+            8,
             6,
-            1,
             4,
+            3,
+            6,
             4,
-            8,
-            10,
+            1,
+            2,
+            9,
             4,
-            6,
-            3,
-            5,
         ]
     )
     assert np.array_equal(manuscripts, expected_manuscripts)
+    assert manuscripts.dtype == np.int64
 
 
 @given(
@@ -77,12 +91,16 @@ def test_create_manuscript_example():
     ),
     imprecision_error_sd=floats(min_value=0, max_value=2),
     other_error_sd=floats(min_value=0, max_value=2),
+    seed=integers(min_value=0, max_value=2**32 - 1),
 )
-def test_review_manuscripts_property(manuscripts, imprecision_error_sd, other_error_sd):
+def test_review_manuscripts_property(
+    manuscripts, imprecision_error_sd, other_error_sd, seed
+):
     reviews = main.review_manuscripts(
         manuscripts=manuscripts,
         imprecision_error_sd=imprecision_error_sd,
         other_error_sd=other_error_sd,
+        seed=seed,
     )
     assert np.min(reviews) >= MIN_MANUSCRIPT_SCORE
     assert np.max(reviews) <= MAX_MANUSCRIPT_SCORE
@@ -90,25 +108,27 @@ def test_review_manuscripts_property(manuscripts, imprecision_error_sd, other_er
 
 
 def test_review_manuscript_example():
-    manuscripts = main.create_manuscripts(number_of_manuscripts=10, seed=0)
+    rng = main.get_generator(0)
+    manuscripts = main.create_manuscripts(number_of_manuscripts=10, seed=rng)
     reviews = main.review_manuscripts(
-        manuscripts=manuscripts, imprecision_error_sd=0.5, other_error_sd=0.25
+        manuscripts=manuscripts, imprecision_error_sd=0.5, other_error_sd=0.25, seed=rng
     )
     expected_reviews = np.array(
         [
-            5.96139635,
-            1,
-            4.2670595,
-            3.0881615,
-            8.45820274,
-            10.0,
-            4.71388049,
-            6.22729218,
-            4.00894418,
-            4.38786077,
+            6.96948235,
+            5.80609677,
+            3.79931936,
+            2.40855371,
+            5.67352798,
+            2.82431920,
+            1.35300807,
+            1.89466840,
+            8.99358856,
+            3.93672158,
         ]
     )
     assert np.allclose(reviews, expected_reviews)
+    assert reviews.dtype == np.float64
 
 
 @given(
@@ -124,22 +144,188 @@ def test_review_manuscripts_expected_statistics(seed):
 
     With b = 10 and a = 0.
     """
-    manuscripts = main.create_manuscripts(number_of_manuscripts=500_000, seed=seed)
+    rng = main.get_generator(seed)
+    manuscripts = main.create_manuscripts(number_of_manuscripts=500_000, seed=rng)
     reviews = main.review_manuscripts(
-        manuscripts=manuscripts, imprecision_error_sd=0, other_error_sd=0.2
+        manuscripts=manuscripts, imprecision_error_sd=0, other_error_sd=0.2, seed=rng
     )
     sampled_other_errors = reviews - manuscripts
     assert np.isclose(np.round(np.mean(sampled_other_errors), 1), 0)
     assert np.isclose(np.round(np.std(sampled_other_errors), 1), 0.2)
 
     reviews = main.review_manuscripts(
-        manuscripts=manuscripts, imprecision_error_sd=0.5, other_error_sd=0
+        manuscripts=manuscripts, imprecision_error_sd=0.5, other_error_sd=0, seed=rng
     )
     sampled_imprecision_errors = reviews - manuscripts
     assert np.isclose(np.round(np.mean(sampled_imprecision_errors), 1), 0)
     assert np.isclose(np.round(np.std(sampled_imprecision_errors), 1), 0.5)
 
 
+def test_review_into():
+    standard_errors = np.array((-2, -0.5, 0, 0.5, 2), dtype=np.float32)
+    manuscripts = np.array((1, 3, 5, 7, 10))
+    out = np.empty(5)
+    reviews = main.review_into(
+        standard_errors=standard_errors, error_sd=2, manuscripts=manuscripts, out=out
+    )
+    assert reviews is out
+    assert np.array_equal(reviews, [1, 2, 5, 8, 10])
+
+    reviews = main.review_into(
+        standard_errors=standard_errors,
+        error_sd=2,
+        manuscripts=manuscripts,
+        out=out,
+        clip=False,
+    )
+    assert np.array_equal(reviews, [-3, 2, 5, 8, 14])
+
+
+def test_review_manuscripts_with_negative_error_sd():
+    rng = main.get_generator(0)
+    manuscripts = main.create_manuscripts(
+        number_of_manuscripts=DEFAULT_NUMBER_OF_MANUSCRIPTS, seed=rng
+    )
+    for imprecision_error_sd, other_error_sd in ((-1, 0), (0, -1)):
+        with pytest.raises(ValueError, match="non-negative"):
+            main.review_manuscripts(
+                manuscripts=manuscripts,
+                imprecision_error_sd=imprecision_error_sd,
+                other_error_sd=other_error_sd,
+                seed=rng,
+            )
+        for process in (
+            main.is_above_threshold_based_on_average,
+            main.is_above_threshold_based_on_vote,
+        ):
+            with pytest.raises(ValueError, match="non-negative"):
+                process(
+                    manuscripts=manuscripts,
+                    number_of_reviews=3,
+                    threshold=5,
+                    imprecision_error_sd=imprecision_error_sd,
+                    other_error_sd=other_error_sd,
+                    seed=rng,
+                )
+        with pytest.raises(ValueError, match="non-negative"):
+            main.sweep_accuracy_of_processes(
+                manuscripts=manuscripts,
+                thresholds=np.arange(1, 11),
+                number_of_reviews=3,
+                imprecision_error_sds=np.array((imprecision_error_sd,)),
+                other_error_sds=np.array((other_error_sd,)),
+                seed=rng,
+            )
+
+
+@given(
+    seed=integers(min_value=0, max_value=2**32 - 1),
+    number_of_generators=integers(min_value=1, max_value=5),
+)
+def test_spawn_generators_property(seed, number_of_generators):
+    generators = main.spawn_generators(
+        number_of_generators=number_of_generators, seed=seed
+    )
+    assert len(generators) == number_of_generators
+    draws = [rng.random() for rng in generators]
+    assert len(set(draws)) == number_of_generators
+
+    generators = main.spawn_generators(
+        number_of_generators=number_of_generators, seed=seed
+    )
+    assert draws == [rng.random() for rng in generators]
+
+    seed_sequence = np.random.SeedSequence(seed)
+    generators = main.spawn_generators(
+        number_of_generators=number_of_generators, seed=seed_sequence
+    )
+    assert seed_sequence.n_children_spawned == number_of_generators
+    assert len(set(rng.random() for rng in generators)) == number_of_generators
+
+
+def test_global_random_state_is_not_used():
+    state = np.random.get_state()
+    rng = main.get_generator(0)
+    manuscripts = main.create_manuscripts(
+        number_of_manuscripts=DEFAULT_NUMBER_OF_MANUSCRIPTS, seed=rng
+    )
+    for process in (
+        main.is_above_threshold_based_on_average,
+        main.is_above_threshold_based_on_vote,
+    ):
+        main.accuracy_of_process(
+            manuscripts=manuscripts,
+            imprecision_error_sd=0.5,
+            threshold=5,
+            process=process,
+            other_error_sd=0.25,
+            number_of_reviews=3,
+            seed=rng,
+        )
+    new_state = np.random.get_state()
+    assert state[0] == new_state[0]
+    assert np.array_equal(state[1], new_state[1])
+    assert state[2:] == new_state[2:]
+
+
+def test_sum_over_reviews_does_not_depend_on_number_of_threads(monkeypatch):
+    rng = main.get_generator(0)
+    manuscripts = main.create_manuscripts(
+        number_of_manuscripts=main.MINIMUM_NUMBER_OF_SAMPLES_FOR_THREADS, seed=rng
+    )
+    sums = []
+    for number_of_cpus in (1, 3):
+        monkeypatch.setattr(main.os, "cpu_count", lambda: number_of_cpus)
+        sums.append(
+            main.sum_over_reviews(
+                function=main.sum_review_scores,
+                number_of_reviews=5,
+                seed=copy.deepcopy(rng),
+                manuscripts=manuscripts,
+                imprecision_error_sd=0.5,
+                other_error_sd=0.25,
+            )
+        )
+    assert np.allclose(sums[0], sums[1])
+
+
+def test_sum_over_reviews_does_not_use_threads_for_few_samples(monkeypatch):
+    def thread_pool_executor(*args, **kwargs):
+        raise AssertionError("No threads should be started.")
+
+    monkeypatch.setattr(main.os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(main, "ThreadPoolExecutor", thread_pool_executor)
+    rng = main.get_generator(0)
+    manuscripts = main.create_manuscripts(
+        number_of_manuscripts=DEFAULT_NUMBER_OF_MANUSCRIPTS, seed=rng
+    )
+    total_review_scores = main.sum_over_reviews(
+        function=main.sum_review_scores,
+        number_of_reviews=5,
+        seed=rng,
+        manuscripts=manuscripts,
+        imprecision_error_sd=0.5,
+        other_error_sd=0.25,
+    )
+    assert total_review_scores.shape == manuscripts.shape
+
+
+def test_sum_over_reviews_with_no_reviews():
+    rng = main.get_generator(0)
+    manuscripts = main.create_manuscripts(
+        number_of_manuscripts=DEFAULT_NUMBER_OF_MANUSCRIPTS, seed=rng
+    )
+    with pytest.raises(ValueError, match="At least one review"):
+        main.sum_over_reviews(
+            function=main.sum_review_scores,
+            number_of_reviews=0,
+            seed=rng,
+            manuscripts=manuscripts,
+            imprecision_error_sd=0.5,
+            other_error_sd=0.25,
+        )
+
+
 @given(
     manuscripts=arrays(
         int,
@@ -162,18 +348,108 @@ def test_is_above_threshold_property(manuscripts, threshold):
 def test_get_average_review_property(
     seed, number_of_reviews, imprecision_error_sd, other_error_sd
 ):
-    manuscripts = main.create_manuscripts(number_of_manuscripts=100_000, seed=seed)
+    rng = main.get_generator(seed)
+    manuscripts = main.create_manuscripts(number_of_manuscripts=100_000, seed=rng)
     average_reviews = main.get_average_review_scores(
         manuscripts=manuscripts,
         number_of_reviews=number_of_reviews,
         imprecision_error_sd=imprecision_error_sd,
         other_error_sd=other_error_sd,
+        seed=rng,
     )
     assert len(average_reviews) == len(manuscripts)
 
     assert np.isclose(np.round(np.mean(average_reviews - manuscripts), 0), 0)
 
 
+@given(
+    seed=integers(min_value=0, max_value=2**32 - 1),
+    error_sd=floats(min_value=1e-12, max_value=1e-6),
+)
+def test_get_average_review_with_small_error_sd(seed, error_sd):
+    """
+    Confirm that errors much smaller than the spacing of 32 bit floats (about 5e-7
+    around 5) are not rounded away: a manuscript on the threshold is accepted
+    based on the average of its errors about half of the time.
+    """
+    manuscripts = np.full(100_000, 5)
+    accept = main.is_above_threshold_based_on_average(
+        manuscripts=manuscripts,
+        number_of_reviews=3,
+        threshold=5,
+        imprecision_error_sd=error_sd,
+        other_error_sd=0,
+        seed=seed,
+    )
+    assert np.isclose(np.round(np.mean(accept), 1), 0.5)
+
+
+@given(
+    seed=integers(min_value=0, max_value=2**32 - 1),
+    number_of_pairs_of_reviews=integers(min_value=1, max_value=3),
+    imprecision_error_sd=floats(min_value=0, max_value=1),
+    other_error_sd=floats(min_value=0, max_value=1),
+)
+def test_get_average_review_with_antithetic_reviews_property(
+    seed, number_of_pairs_of_reviews, imprecision_error_sd, other_error_sd
+):
+    rng = main.get_generator(seed)
+    manuscripts = main.create_manuscripts(number_of_manuscripts=100_000, seed=rng)
+    average_reviews = main.get_average_review_scores(
+        manuscripts=manuscripts,
+        number_of_reviews=2 * number_of_pairs_of_reviews,
+        imprecision_error_sd=imprecision_error_sd,
+        other_error_sd=other_error_sd,
+        seed=rng,
+        method="antithetic",
+    )
+    assert len(average_reviews) == len(manuscripts)
+    assert np.min(average_reviews) >= MIN_MANUSCRIPT_SCORE
+    assert np.max(average_reviews) <= MAX_MANUSCRIPT_SCORE
+
+    assert np.isclose(np.round(np.mean(average_reviews - manuscripts), 0), 0)
+
+
+def test_get_average_review_antithetic_reviews_reduce_variance():
+    rng = main.get_generator(0)
+    manuscripts = main.create_manuscripts(number_of_manuscripts=100_000, seed=rng)
+    variances = [
+        np.var(
+            main.get_average_review_scores(
+                manuscripts=manuscripts,
+                number_of_reviews=4,
+                imprecision_error_sd=0.5,
+                other_error_sd=0.5,
+                seed=rng,
+                method=method,
+            )
+            - manuscripts
+        )
+        for method in ("mc", "antithetic")
+    ]
+    assert variances[1] < variances[0]
+
+
+def test_get_average_review_with_invalid_method():
+    manuscripts = main.create_manuscripts(number_of_manuscripts=10, seed=0)
+    with pytest.raises(ValueError):
+        main.get_average_review_scores(
+            manuscripts=manuscripts,
+            number_of_reviews=3,
+            imprecision_error_sd=0.5,
+            other_error_sd=0.5,
+            method="antithetic",
+        )
+    with pytest.raises(ValueError):
+        main.get_average_review_scores(
+            manuscripts=manuscripts,
+            number_of_reviews=4,
+            imprecision_error_sd=0.5,
+            other_error_sd=0.5,
+            method="sobol",
+        )
+
+
 @given(
     seed=integers(min_value=0, max_value=2**32 - 1),
     number_of_reviews=integers(min_value=1, max_value=5),
@@ -184,8 +460,9 @@ def test_get_average_review_property(
 def test_is_above_threshold_based_on_average(
     seed, number_of_reviews, imprecision_error_sd, other_error_sd, threshold
 ):
+    rng = main.get_generator(seed)
     manuscripts = main.create_manuscripts(
-        number_of_manuscripts=DEFAULT_NUMBER_OF_MANUSCRIPTS, seed=seed
+        number_of_manuscripts=DEFAULT_NUMBER_OF_MANUSCRIPTS, seed=rng
     )
     accept = main.is_above_threshold_based_on_average(
         manuscripts=manuscripts,
@@ -193,12 +470,29 @@ def test_is_above_threshold_based_on_average(
         other_error_sd=other_error_sd,
         threshold=threshold,
         number_of_reviews=number_of_reviews,
+        seed=rng,
     )
     assert len(accept) == len(manuscripts)
     assert set(accept) <= {True, False}
 
 
 def test_count_votes():
+    threshold = 7
+    reviews = np.stack(
+        (
+            np.array((1, 5, 8)),
+            np.array((8, 8, 8)),
+            np.array((10, 9, 1)),
+            np.array((10, 1, 2)),
+            np.array((9, 9, 5)),
+        )
+    )
+    number_of_votes = main.count_votes(reviews=reviews, threshold=threshold)
+    assert np.array_equal(number_of_votes, [4, 3, 2])
+    assert number_of_votes.dtype == np.int32
+
+
+def test_count_votes_from_generator():
     threshold = 7
     reviews = (
         np.array((1, 5, 8)),
@@ -207,8 +501,84 @@ def test_count_votes():
         np.array((10, 1, 2)),
         np.array((9, 9, 5)),
     )
-    number_of_votes = main.count_votes(reviews=reviews, threshold=threshold)
+    number_of_votes = main.count_votes(
+        reviews=(review for review in reviews), threshold=threshold
+    )
     assert np.array_equal(number_of_votes, [4, 3, 2])
+    assert number_of_votes.dtype == np.int32
+
+    out = np.full(3, 5)
+    for reviews_to_count in ((review for review in reviews), np.stack(reviews)):
+        number_of_votes = main.count_votes(
+            reviews=reviews_to_count, threshold=threshold, out=out
+        )
+        assert number_of_votes is out
+        assert np.array_equal(out, [4, 3, 2])
+
+
+def test_count_votes_from_empty_generator():
+    out = np.full(3, 5)
+    number_of_votes = main.count_votes(reviews=iter(()), threshold=7, out=out)
+    assert number_of_votes is out
+    assert np.array_equal(out, [0, 0, 0])
+
+    with pytest.raises(ValueError, match="empty iterable"):
+        main.count_votes(reviews=iter(()), threshold=7)
+
+
+@given(
+    seed=integers(min_value=0, max_value=2**32 - 1),
+    manuscripts=arrays(
+        int,
+        DEFAULT_NUMBER_OF_MANUSCRIPTS,
+        elements=integers(min_value=-1, max_value=12),
+    ),
+    as_list=booleans(),
+    number_of_reviews=integers(min_value=1, max_value=5),
+    imprecision_error_sd=floats(min_value=0, max_value=1),
+    other_error_sd=floats(min_value=0, max_value=1),
+    threshold=integers(min_value=0, max_value=22).map(lambda value: value / 2),
+)
+def test_count_votes_of_reviews_property(
+    seed,
+    manuscripts,
+    as_list,
+    number_of_reviews,
+    imprecision_error_sd,
+    other_error_sd,
+    threshold,
+):
+    """
+    Confirm that the votes are those of the clipped reviews, including for
+    manuscripts outside of [1, 10], thresholds outside of (1, 10] and manuscripts
+    given as a list.
+    """
+    rng = main.get_generator(seed)
+    number_of_votes = main.count_votes_of_reviews(
+        generators=main.spawn_generators(
+            number_of_generators=number_of_reviews, seed=copy.deepcopy(rng)
+        ),
+        manuscripts=manuscripts.tolist() if as_list else manuscripts,
+        threshold=threshold,
+        imprecision_error_sd=imprecision_error_sd,
+        other_error_sd=other_error_sd,
+    )
+    reviews = np.array(
+        [
+            main.review_manuscripts(
+                manuscripts=manuscripts,
+                imprecision_error_sd=imprecision_error_sd,
+                other_error_sd=other_error_sd,
+                seed=review_rng,
+            )
+            for review_rng in main.spawn_generators(
+                number_of_generators=number_of_reviews, seed=rng
+            )
+        ]
+    )
+    expected_number_of_votes = main.count_votes(reviews=reviews, threshold=threshold)
+    assert np.array_equal(number_of_votes, expected_number_of_votes)
+    assert number_of_votes.dtype == np.int32
 
 
 @given(
@@ -221,8 +591,9 @@ def test_count_votes():
 def test_is_above_threshold_based_on_vote(
     seed, number_of_reviews, imprecision_error_sd, other_error_sd, threshold
 ):
+    rng = main.get_generator(seed)
     manuscripts = main.create_manuscripts(
-        number_of_manuscripts=DEFAULT_NUMBER_OF_MANUSCRIPTS, seed=seed
+        number_of_manuscripts=DEFAULT_NUMBER_OF_MANUSCRIPTS, seed=rng
     )
     accept = main.is_above_threshold_based_on_vote(
         manuscripts=manuscripts,
@@ -230,6 +601,7 @@ def test_is_above_threshold_based_on_vote(
         other_error_sd=other_error_sd,
         threshold=threshold,
         number_of_reviews=number_of_reviews,
+        seed=rng,
     )
     assert len(accept) == len(manuscripts)
     assert set(accept) <= {True, False}
@@ -245,8 +617,9 @@ def test_is_above_threshold_based_on_vote(
 def test_accuracy_of_process(
     seed, number_of_reviews, imprecision_error_sd, other_error_sd, threshold
 ):
+    rng = main.get_generator(seed)
     manuscripts = main.create_manuscripts(
-        number_of_manuscripts=DEFAULT_NUMBER_OF_MANUSCRIPTS, seed=seed
+        number_of_manuscripts=DEFAULT_NUMBER_OF_MANUSCRIPTS, seed=rng
     )
     for process in (
         main.is_above_threshold_based_on_average,
@@ -259,5 +632,196 @@ def test_accuracy_of_process(
             process=process,
             other_error_sd=other_error_sd,
             number_of_reviews=number_of_reviews,
+            seed=rng,
         )
         assert 0 <= accuracy <= 1
+
+
+@given(
+    seed=integers(min_value=0, max_value=2**32 - 1),
+    number_of_reviews=integers(min_value=1, max_value=5),
+    imprecision_error_sd=floats(min_value=0, max_value=1),
+    other_error_sd=floats(min_value=0, max_value=1),
+    threshold=integers(min_value=1, max_value=10),
+)
+def test_accuracy_of_process_with_accurate_decisions(
+    seed, number_of_reviews, imprecision_error_sd, other_error_sd, threshold
+):
+    rng = main.get_generator(seed)
+    manuscripts = main.create_manuscripts(
+        number_of_manuscripts=DEFAULT_NUMBER_OF_MANUSCRIPTS, seed=rng
+    )
+    accurate_decisions = main.is_above_threshold(
+        manuscripts=manuscripts, threshold=threshold
+    )
+    for process in (
+        main.is_above_threshold_based_on_average,
+        main.is_above_threshold_based_on_vote,
+    ):
+        accuracies = [
+            main.accuracy_of_process(
+                manuscripts=manuscripts,
+                imprecision_error_sd=imprecision_error_sd,
+                threshold=threshold,
+                process=process,
+                other_error_sd=other_error_sd,
+                number_of_reviews=number_of_reviews,
+                seed=copy.deepcopy(rng),
+                accurate_decisions=decisions,
+            )
+            for decisions in (None, accurate_decisions)
+        ]
+        assert accuracies[0] == accuracies[1]
+
+
+@given(
+    seed=integers(min_value=0, max_value=2**32 - 1),
+    number_of_reviews=integers(min_value=1, max_value=5),
+    imprecision_error_sd=floats(min_value=0, max_value=1),
+    other_error_sd=floats(min_value=0, max_value=1),
+    threshold=integers(min_value=1, max_value=10),
+)
+def test_specialise_accuracy_of_process(
+    seed, number_of_reviews, imprecision_error_sd, other_error_sd, threshold
+):
+    rng = main.get_generator(seed)
+    manuscripts = main.create_manuscripts(
+        number_of_manuscripts=DEFAULT_NUMBER_OF_MANUSCRIPTS, seed=rng
+    )
+    specialised_accuracy_of_process = main.specialise_accuracy_of_process(
+        manuscripts=manuscripts, threshold=threshold
+    )
+    for process in (
+        main.is_above_threshold_based_on_average,
+        main.is_above_threshold_based_on_vote,
+    ):
+        accuracy = specialised_accuracy_of_process(
+            process=process,
+            number_of_reviews=number_of_reviews,
+            imprecision_error_sd=imprecision_error_sd,
+            other_error_sd=other_error_sd,
+            seed=copy.deepcopy(rng),
+        )
+        assert accuracy == main.accuracy_of_process(
+            manuscripts=manuscripts,
+            threshold=threshold,
+            process=process,
+            number_of_reviews=number_of_reviews,
+            imprecision_error_sd=imprecision_error_sd,
+            other_error_sd=other_error_sd,
+            seed=copy.deepcopy(rng),
+        )
+
+
+@given(
+    seed=integers(min_value=0, max_value=2**32 - 1),
+    number_of_reviews=integers(min_value=1, max_value=5),
+)
+def test_sweep_accuracy_of_processes(seed, number_of_reviews):
+    rng = main.get_generator(seed)
+    manuscripts = main.create_manuscripts(
+        number_of_manuscripts=DEFAULT_NUMBER_OF_MANUSCRIPTS, seed=rng
+    )
+    standard_errors = copy.deepcopy(rng).standard_normal(
+        size=(number_of_reviews, DEFAULT_NUMBER_OF_MANUSCRIPTS), dtype=np.float32
+    )
+    thresholds = np.arange(1, 11)
+    imprecision_error_sds = np.array((0, 0.5, 1))
+    other_error_sds = np.array((0, 0.25))
+    average_accuracies, vote_accuracies = main.sweep_accuracy_of_processes(
+        manuscripts=manuscripts,
+        thresholds=thresholds,
+        number_of_reviews=number_of_reviews,
+        imprecision_error_sds=imprecision_error_sds,
+        other_error_sds=other_error_sds,
+        seed=rng,
+    )
+    for accuracies in (average_accuracies, vote_accuracies):
+        assert accuracies.shape == (3, 2, 10)
+        assert np.all((0 <= accuracies) & (accuracies <= 1))
+    assert np.all(average_accuracies[0, 0] == 1)
+
+    for i, imprecision_error_sd in enumerate(imprecision_error_sds):
+        for j, other_error_sd in enumerate(other_error_sds):
+            error_sd = np.hypot(imprecision_error_sd, other_error_sd)
+            reviews = np.clip(
+                standard_errors.astype(np.float64) * error_sd + manuscripts, 1, 10
+            )
+            for k, threshold in enumerate(thresholds):
+                accurate_decisions = manuscripts >= threshold
+                average_decisions = reviews.mean(axis=0) >= threshold
+                vote_decisions = (
+                    np.sum(reviews >= threshold, axis=0) >= number_of_reviews // 2
+                )
+                assert average_accuracies[i, j, k] == np.mean(
+                    average_decisions == accurate_decisions
+                )
+                assert vote_accuracies[i, j, k] == np.mean(
+                    vote_decisions == accurate_decisions
+                )
+
+
+def test_get_standard_errors():
+    standard_errors = main.get_standard_errors(
+        number_of_reviews=3, number_of_manuscripts=10, seed=0
+    )
+    assert standard_errors.shape == (3, 10)
+    assert standard_errors.dtype == np.float32
+    assert not standard_errors.flags.writeable
+    assert standard_errors is main.get_standard_errors(
+        number_of_reviews=3, number_of_manuscripts=10, seed=0
+    )
+
+
+def test_get_standard_errors_cache_clear():
+    standard_errors = main.get_standard_errors(
+        number_of_reviews=3, number_of_manuscripts=10, seed=0
+    )
+    main.get_standard_errors.cache_clear()
+    assert main.get_standard_errors.cache_info().currsize == 0
+    new_standard_errors = main.get_standard_errors(
+        number_of_reviews=3, number_of_manuscripts=10, seed=0
+    )
+    assert new_standard_errors is not standard_errors
+    assert np.array_equal(new_standard_errors, standard_errors)
+
+
+def test_sweep_accuracy_of_processes_with_numpy_integer_seed():
+    main.get_standard_errors.cache_clear()
+    manuscripts = main.create_manuscripts(
+        number_of_manuscripts=DEFAULT_NUMBER_OF_MANUSCRIPTS, seed=main.get_generator(1)
+    )
+    accuracies = [
+        main.sweep_accuracy_of_processes(
+            manuscripts=manuscripts,
+            thresholds=np.arange(1, 11),
+            number_of_reviews=3,
+            imprecision_error_sds=np.array((0.5,)),
+            other_error_sds=np.array((0.25,)),
+            seed=seed,
+        )
+        for seed in (0, np.int64(0))
+    ]
+    cache_info = main.get_standard_errors.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 1)
+    assert np.array_equal(accuracies[0][0], accuracies[1][0])
+    assert np.array_equal(accuracies[0][1], accuracies[1][1])
+
+
+def test_sweep_accuracy_of_processes_with_generator():
+    manuscripts = main.create_manuscripts(
+        number_of_manuscripts=DEFAULT_NUMBER_OF_MANUSCRIPTS, seed=main.get_generator(1)
+    )
+    accuracies = [
+        main.sweep_accuracy_of_processes(
+            manuscripts=manuscripts,
+            thresholds=np.arange(1, 11),
+            number_of_reviews=3,
+            imprecision_error_sds=np.array((0.5,)),
+            other_error_sds=np.array((0.25,)),
+            seed=seed,
+        )
+        for seed in (0, main.get_generator(0))
+    ]
+    assert np.array_equal(accuracies[0][0], accuracies[1][0])
+    assert np.array_equal(accuracies[0][1], accuracies[1][1])